@@ -1,21 +1,213 @@
 import argparse
+import concurrent.futures
 import multiprocessing
-from utils.parser import PDFExtractor, list_pdfs_in_folder
+import os
+import pickle
+import signal
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import forkserver, shared_memory
+from utils.parser import PDFExtractor, list_pdfs_with_sizes, load_config
 
-def process_pdf(args):
+# Per-worker state set once by init_worker
+_OUTPUT_FOLDER = None
+_CONFIG = None
+_COLLECT_RESULTS = False
+_TIMEOUT = None
+_EXTRACTOR = None
+
+class PDFTimeoutError(BaseException):
+    """
+    Raised when a PDF exceeds the per-file timeout.
+
+    Derives from BaseException so the per-step error handling in
+    PDFExtractor.extract_all does not swallow it.
+    """
+
+def _raise_timeout(signum, frame):
+    raise PDFTimeoutError(f"timed out after {_TIMEOUT} seconds")
+
+def init_worker(output_folder, config_path, collect_results=False, timeout=None):
+    """
+    Pool initializer that stores the output folder and parses the cleanup
+    configuration once per worker process.
+
+    The per-PDF timeout relies on SIGALRM and is ignored on platforms without it.
+    """
+    global _OUTPUT_FOLDER, _CONFIG, _COLLECT_RESULTS, _TIMEOUT
+    _OUTPUT_FOLDER = output_folder
+    _CONFIG = load_config(config_path)
+    _COLLECT_RESULTS = collect_results
+    if timeout and hasattr(signal, "SIGALRM"):
+        _TIMEOUT = timeout
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+def done_marker_path(pdf_path, output_folder):
+    """
+    Returns the path of the marker file written once a PDF has been fully processed.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        output_folder (str): Path to the folder where outputs are saved.
+
+    Returns:
+        str: Path of the marker file.
+    """
+    doc_name = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(output_folder, f"{doc_name}.done")
+
+def publish_result(data):
+    """
+    Copies a pickled extraction result into a new shared memory block.
+
+    The cleaned text, usually the largest part of a result, is encoded and pickled
+    out-of-band: the pickle stream is written first, followed by the text bytes,
+    so the text is not copied into the pickle stream as well.
+
+    Args:
+        data (dict): The extraction result to publish.
+
+    Returns:
+        tuple: The shared memory block name and the sizes of the pickle stream
+            and each out-of-band buffer, in layout order.
+    """
+    data = dict(data)
+    if isinstance(data.get("cleaned_text"), str):
+        data["cleaned_text"] = pickle.PickleBuffer(data["cleaned_text"].encode("utf-8"))
+
+    buffers = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    chunks = [memoryview(payload)] + [buffer.raw() for buffer in buffers]
+    sizes = tuple(chunk.nbytes for chunk in chunks)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    offset = 0
+    for chunk, size in zip(chunks, sizes):
+        shm.buf[offset:offset + size] = chunk
+        offset += size
+    shm.close()
+    return shm.name, sizes
+
+def read_result(name, sizes):
+    """
+    Reads an extraction result published by publish_result and frees its block.
+
+    Args:
+        name (str): The shared memory block name.
+        sizes (tuple): The pickle stream and out-of-band buffer sizes.
+
+    Returns:
+        dict: The extraction result.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        raw = memoryview(bytes(shm.buf[:sum(sizes)]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+    chunks = [raw[start:end] for start, end in zip(offsets, offsets[1:])]
+    data = pickle.loads(chunks[0], buffers=chunks[1:])
+    if isinstance(data.get("cleaned_text"), memoryview):
+        data["cleaned_text"] = str(data["cleaned_text"], "utf-8")
+    return data
+
+def process_pdf(pdf_path):
     """
     Worker function to process a single PDF file.
+
+    Progress is reported by the parent process, so the worker does not print.
+    Each worker keeps one PDFExtractor and resets it for every new file.
+
+    Returns:
+        tuple: The PDF path; when results are collected, the shared memory name
+            and layout sizes holding the extracted data (None otherwise); and the
+            error message if processing failed (None otherwise).
+    """
+    global _EXTRACTOR
+    try:
+        if _TIMEOUT:
+            signal.alarm(_TIMEOUT)
+        try:
+            if _EXTRACTOR is None:
+                _EXTRACTOR = PDFExtractor(pdf_path, output_folder=_OUTPUT_FOLDER, config=_CONFIG)
+            else:
+                _EXTRACTOR.reset(pdf_path)
+            extracted_data = _EXTRACTOR.extract_all()
+        finally:
+            if _TIMEOUT:
+                signal.alarm(0)
+        # extract_all only logs output errors, so a PDF whose JSON was not written is
+        # reported as failed and is not marked as done
+        if _EXTRACTOR.json_output_path is None:
+            return pdf_path, None, "the JSON output could not be saved"
+        # Mark the PDF as done so a resumed run can skip it
+        open(done_marker_path(pdf_path, _OUTPUT_FOLDER), "wb").close()
+        if _COLLECT_RESULTS:
+            return pdf_path, publish_result(extracted_data), None
+    except (Exception, PDFTimeoutError) as e:
+        return pdf_path, None, str(e)
+    return pdf_path, None, None
+
+def get_pool_context():
+    """
+    Returns the multiprocessing context used to start extraction workers.
+
+    Uses a fork server with the parser module preloaded where available, so each
+    worker is cloned from a small process that already imported PyMuPDF. The
+    server is started right away so the preload runs while the caller keeps working.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["utils.parser"])
+        forkserver.ensure_running()
+        return ctx
+    return multiprocessing.get_context()
+
+def default_worker_count(num_pdfs):
+    """
+    Returns the default number of worker processes for a batch of PDFs.
+
+    Uses the CPUs this process may run on (or the CPU count where affinity is
+    not available), capped by the number of PDFs to process.
+
+    Args:
+        num_pdfs (int): Number of PDFs to process.
+
+    Returns:
+        int: Number of worker processes.
     """
-    pdf_path, output_folder, config_path = args
     try:
-        print(f"Processing: {pdf_path}")
-        extractor = PDFExtractor(pdf_path, output_folder=output_folder, config_path=config_path)
-        extracted_data = extractor.extract_all()
-        print(f"Extraction completed for: {pdf_path}")
-    except Exception as e:
-        print(f"Error processing {pdf_path}: {e}")
+        available_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        available_cpus = os.cpu_count() or 1
+    return max(1, min(num_pdfs, available_cpus))
+
+def positive_int(value):
+    """
+    Argument type accepting integers of at least 1.
+
+    Args:
+        value (str): The command-line value.
+
+    Returns:
+        int: The parsed value.
 
-def main(folder_path, output_folder, config_path):
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def main(folder_path, output_folder, config_path, collect_results=False, workers=None, timeout=None,
+         resume=False):
     """
     Main function to extract information from PDF files in a folder using multiprocessing.
 
@@ -23,23 +215,63 @@ def main(folder_path, output_folder, config_path):
         folder_path (str): Path to the folder containing PDF files.
         output_folder (str): Path to the folder where outputs will be saved.
         config_path (str): Path to the configuration JSON file.
+        collect_results (bool): Whether to send the extracted data back to the caller.
+        workers (int, optional): Number of worker processes. Defaults to the number
+            of available CPUs, capped by the number of PDFs.
+        timeout (int, optional): Maximum number of seconds spent on a single PDF.
+        resume (bool): Whether to skip PDFs already processed by a previous run.
+
+    Returns:
+        dict: Extracted data keyed by PDF path when collect_results is True, else None.
     """
-    # List all PDFs in the specified folder
-    doc_list = list_pdfs_in_folder(folder_path)
+    # Start the worker context first so its preload overlaps with listing the folder
+    ctx = get_pool_context()
 
-    if not doc_list:
+    # List all PDFs in the specified folder, largest first so small files
+    # fill in the tail of the run
+    pdf_files = list_pdfs_with_sizes(folder_path)
+
+    if not pdf_files:
         print(f"No PDF files found in folder: {folder_path}")
-        return
+        return {} if collect_results else None
 
     # Prepare arguments for multiprocessing
-    args_list = [(f"{folder_path}/{doc}", output_folder, config_path) for doc in doc_list]
+    args_list = [pdf_path for pdf_path, _ in pdf_files]
+
+    if resume:
+        pending = [pdf_path for pdf_path in args_list
+                   if not os.path.exists(done_marker_path(pdf_path, output_folder))]
+        print(f"Resuming: skipping {len(args_list) - len(pending)} already processed PDF files.")
+        args_list = pending
+        if not args_list:
+            return {} if collect_results else None
 
     # Use multiprocessing to process PDFs
-    num_processes = max(1, multiprocessing.cpu_count() - 4)
+    num_processes = workers if workers is not None else default_worker_count(len(args_list))
     print(f"Using {num_processes} processes for extraction.")
-    
-    with multiprocessing.Pool(processes=num_processes) as pool:
-        pool.map(process_pdf, args_list)
+
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_processes, mp_context=ctx, initializer=init_worker,
+        initargs=(output_folder, config_path, collect_results, timeout)
+    ) as executor:
+        # Submit one future per PDF so idle workers pick up the next file immediately
+        futures = [executor.submit(process_pdf, pdf_path) for pdf_path in args_list]
+        try:
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                pdf_path, shm_info, error = future.result()
+                if error is not None:
+                    print(f"[{done}/{len(futures)}] Error processing {pdf_path}: {error}")
+                else:
+                    print(f"[{done}/{len(futures)}] Extraction completed for: {pdf_path}")
+                if shm_info is not None:
+                    results[pdf_path] = read_result(*shm_info)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a crash inside PyMuPDF); the remaining PDFs cannot run
+            print(f"A worker process terminated abruptly, cancelling remaining PDFs: {e}")
+            executor.shutdown(cancel_futures=True)
+
+    return results if collect_results else None
 
 if __name__ == "__main__":
     # Set up command-line argument parsing
@@ -47,11 +279,18 @@ if __name__ == "__main__":
     parser.add_argument("--folder_path", required=True, help="Path to the folder containing PDF files.")
     parser.add_argument("--output_folder", required=True, help="Path to the folder for saving outputs.")
     parser.add_argument("--config_path", required=True, help="Path to the text cleanup configuration file.")
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="Number of worker processes (default: available CPUs, capped by the number of PDFs).")
+    parser.add_argument("--timeout", type=int, default=None,
+                        help="Maximum number of seconds to spend on a single PDF (Unix only).")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip PDF files already processed by a previous run.")
     
     args = parser.parse_args()
     
     # Run the main function with parsed arguments
-    main(args.folder_path, args.output_folder, args.config_path)
+    main(args.folder_path, args.output_folder, args.config_path, workers=args.workers, timeout=args.timeout,
+         resume=args.resume)
 
 
 
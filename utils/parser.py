@@ -1,18 +1,198 @@
 import fitz  # PyMuPDF
+import bisect
+import concurrent.futures
 import os
 import json
 import re
-from itertools import product
-from collections import defaultdict, OrderedDict
+import sys
+from functools import lru_cache
 
 import logging
 
+try:
+    import orjson  # Optional, faster JSON output
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Precompiled regex patterns used across the text and title processing steps
+_WHITESPACE_RE = re.compile(r"\s+")
+_TITLE_SUFFIX_RE = re.compile(r"(.*?)([A-Z]+\s*|\d+\s*)*$")  # Trailing uppercase letters or digits
+_NUMBERED_TITLE_RE = re.compile(r"^\d+(\.\d+)*\.?\s")  # "1. ", "1.1 ", "1.1.1. "
+_TRAILING_NUMBERING_RE = re.compile(r"(.*?)(\d+(\.\d+)*\.)$")  # Number chains attached to the end
+# Title numbering format, tried in order: "1.1.1. Title", then "1.1.Title" or
+# "1.1.1.Title", then "1.Title"; the named group that matched gives the format
+_TITLE_LEVEL_RE = re.compile(r"\d+\.(?:\d+\.(?:(?P<level3>\d+\.\s+.)|(?P<level2>.))|(?P<level1>.))")
+_LEVEL1_PLAIN_TITLE_RE = re.compile(r"^\d+\.\s*.+")
+_SUBLEVEL_NUMBERING_RE = re.compile(r"((\d+\.){2,3})")
+_LEVEL1_NUMBERING_RE = re.compile(r"^\d+\.\s*")
+_NUMBERING_CHUNK_RE = re.compile(r"\d+[\.\s]*")
+_NUMBERING_PREFIX_RE = re.compile(r"^(\d+(?:\.\d+)*)\.")  # "1.", "1.1.", "1.1.1."; group 1 drops the last dot
+_KEY_NUMBERING_RE = re.compile(r"^(\d+(\.\d+)*)(\.?)(\s*)(.*)")  # Numbering and title of a key
+_STRING_NUMBERING_RE = re.compile(r"^(\d+(?:\.\d+)*\.*)(.*)$")
+_LEADING_NUMBERING_RE = re.compile(r"^(\d+(\.\d+)*)")
+_OPTIONAL_NUMBERING_TITLE_RE = re.compile(r"^\s*(\d+(\.\d+)*\.?\s*)?(.*)")
+_TITLE_NUMBERING_STRIP_RE = re.compile(r"^\d+(\.\d+)*\.\s*")  # Numbering and spaces before a title
+_ROOT_KEY_RE = re.compile(r"(?!\d)|\d+\.(?!\d).*$")  # No numbering, "X." or "X. Title" (not "X.Y")
+_NUMBERING_CHARS_RE = re.compile(r"[\d.]*")  # Leading digits and dots of a title
+_LAST_UPPER_RE = re.compile(r"[A-Z][^A-Z]*\Z")  # Last ASCII uppercase letter
+
+# Numbering formats searched in front of unnumbered TOC titles, deepest first
+_TITLE_NUMBERING_PATTERNS = [
+    r"\d+\.\d+\.\d+\.\d+", r"\d+\.\d+\.\d+\.", r"\d+\.\d+\.\d+", r"\d+\.\d+\.",
+    r"\d+\.\d+", r"\d+\.", r"\d+"
+]
+
+# Parsed configuration files keyed by (absolute path, modification time)
+_CONFIG_CACHE = {}
+
+# Compiled cleanup steps of the cached configurations, keyed by id() of the
+# configuration dict; each entry keeps a reference to its dict so ids are not reused
+_COMPILED_CONFIG_CACHE = {}
+
+# Texts up to this length (titles, short sections) have their cleaned form memoized
+_CLEAN_TEXT_CACHE_MAX_LENGTH = 256
+_CLEAN_TEXT_CACHE_SIZE = 4096
+
+# Documents with fewer pages are always extracted in the calling process
+_MIN_PAGES_FOR_PARALLEL_EXTRACTION = 8
+
+def _content_clip(page_rect, margins):
+    """
+    Returns the page area left after removing the header and footer margins.
+
+    Args:
+        page_rect (fitz.Rect): The page rectangle.
+        margins (tuple): Header and footer heights to exclude.
+
+    Returns:
+        fitz.Rect: The content area.
+    """
+    header_height, footer_height = margins
+    return fitz.Rect(
+        page_rect.x0,
+        page_rect.y0 + header_height,
+        page_rect.x1,
+        page_rect.y1 - footer_height
+    )
+
+@lru_cache(maxsize=_CLEAN_TEXT_CACHE_SIZE)
+def _clean_title_suffix(title):
+    """
+    Removes trailing uppercase letters or digits from the end of a title.
+
+    Args:
+        title (str): The title to clean.
+
+    Returns:
+        str: Cleaned title.
+    """
+    match = _TITLE_SUFFIX_RE.match(title)
+    return match.group(1).strip() if match else title
+
+@lru_cache(maxsize=None)
+def _format_numbering(parts):
+    """
+    Formats the integer parts of a numbering, sharing the string between identical numberings.
+
+    Args:
+        parts (tuple): The integer parts of the numbering (e.g., (1, 2)).
+
+    Returns:
+        str: The numbering with a trailing dot (e.g., "1.2.").
+    """
+    return '.'.join(map(str, parts)) + '.'
+
+def _apply_text_cleanup(text, special_character_steps, expression_patterns):
+    """
+    Applies compiled cleanup steps to a text.
+
+    Args:
+        text (str): The raw text to clean.
+        special_character_steps (list): Translation tables and strings to remove.
+        expression_patterns (list): Compiled patterns whose matches are removed.
+
+    Returns:
+        str: Cleaned text.
+    """
+    try:
+        for step in special_character_steps:
+            text = text.translate(step) if isinstance(step, dict) else text.replace(step, "")
+
+        for pattern in expression_patterns:
+            text = pattern.sub("", text)
+
+        text = _WHITESPACE_RE.sub(" ", text).strip()
+        return text
+    except Exception as e:
+        raise RuntimeError(f"Error during text cleaning: {e}")
+
+def _short_text_cleaner(special_character_steps, expression_patterns):
+    """
+    Returns a memoized cleanup function for short texts. It only refers to the compiled
+    steps, so the extractors using it are not kept alive by its cache.
+
+    Args:
+        special_character_steps (list): Translation tables and strings to remove.
+        expression_patterns (list): Compiled patterns whose matches are removed.
+
+    Returns:
+        callable: A function cleaning a text with the given steps.
+    """
+    @lru_cache(maxsize=_CLEAN_TEXT_CACHE_SIZE)
+    def clean_short_text(text):
+        return _apply_text_cleanup(text, special_character_steps, expression_patterns)
+    return clean_short_text
+
+def _split_title_numbering(title):
+    """
+    Splits a title into its leading numbering and the rest of the title.
+
+    Args:
+        title (str): The title, possibly starting with a numbering (e.g., "1.2. Scope").
+
+    Returns:
+        tuple: The numbering (empty string if the title has none) and the text after
+            the first space (None if the title has no space).
+    """
+    parts = title.split(' ', 1)
+    numbering = parts[0] if parts[0].replace('.', '').isdigit() else ""
+    return numbering, parts[1] if len(parts) > 1 else None
+
+def _extract_page_range(pdf_path, start, end, margins=None):
+    """
+    Extracts the text of a contiguous range of pages. Runs in a worker process,
+    so the document is opened again there.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        start (int): First 0-based page index.
+        end (int): Page index after the last page to extract.
+        margins (tuple, optional): Header and footer heights to exclude.
+
+    Returns:
+        list: The text of each page in the range (empty for pages without text).
+    """
+    with fitz.open(pdf_path) as doc:
+        page_texts = []
+        page_rect = clip = None
+        for page_num in range(start, end):
+            if not doc.get_page_fonts(page_num):
+                page_texts.append("")
+                continue
+            page = doc.load_page(page_num)
+            # Pages usually share one size, so the clip is rebuilt only when it changes
+            if margins is not None and page.rect != page_rect:
+                page_rect = page.rect
+                clip = _content_clip(page_rect, margins)
+            page_texts.append(page.get_text("text", clip=clip))
+        return page_texts
+
 def list_pdfs_in_folder(folder_path):
     """
     Lists all PDF files in the specified folder.
@@ -24,14 +204,64 @@ def list_pdfs_in_folder(folder_path):
         list: A list of PDF file names in the folder.
     """
     try:
-        # List all files in the folder and filter for PDFs
-        pdf_files = [file for file in os.listdir(folder_path) if file.endswith('.pdf')]
+        # List the files in the folder and keep the PDFs, whatever the extension case
+        with os.scandir(folder_path) as entries:
+            return [entry.name for entry in entries if entry.name.lower().endswith('.pdf') and entry.is_file()]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The folder '{folder_path}' does not exist.")
+    except Exception as e:
+        raise RuntimeError(f"An error occurred while listing PDF files: {e}")
+
+def list_pdfs_with_sizes(folder_path):
+    """
+    Lists all PDF files in the specified folder with their sizes, largest first.
+
+    Args:
+        folder_path (str): The path to the folder.
+
+    Returns:
+        list: A list of (path, size in bytes) tuples sorted by decreasing size.
+    """
+    try:
+        with os.scandir(folder_path) as entries:
+            pdf_files = [
+                (entry.path, entry.stat().st_size)
+                for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
+        pdf_files.sort(key=lambda item: item[1], reverse=True)
         return pdf_files
     except FileNotFoundError:
         raise FileNotFoundError(f"The folder '{folder_path}' does not exist.")
     except Exception as e:
         raise RuntimeError(f"An error occurred while listing PDF files: {e}")
 
+def load_config(config_path):
+    """
+    Loads a JSON configuration file for text cleanup rules.
+
+    The parsed data is cached per file and parsed again only when the file is modified,
+    so the returned dict is shared and must not be modified.
+
+    Args:
+        config_path (str): Path to the configuration file.
+
+    Returns:
+        dict: Parsed configuration data.
+    """
+    try:
+        key = (os.path.abspath(config_path), os.path.getmtime(config_path))
+        config = _CONFIG_CACHE.get(key)
+        if config is None:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            _CONFIG_CACHE[key] = config
+        return config
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found at: {config_path}")
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid JSON format in configuration file: {config_path}")
+
 
 class PDFExtractor:
     """
@@ -39,7 +269,7 @@ class PDFExtractor:
     Provides methods for cleaning text, extracting metadata, and handling TOC.
     """
 
-    def __init__(self, pdf_path, output_folder="outputs", config_path="text_cleanup_config.json"):
+    def __init__(self, pdf_path, output_folder="outputs", config_path="text_cleanup_config.json", config=None):
         """
         Initializes the PDFExtractor with a PDF file, output folder, and text cleanup configuration.
 
@@ -47,14 +277,56 @@ class PDFExtractor:
             pdf_path (str): Path to the PDF file.
             output_folder (str): Directory for storing output files.
             config_path (str): Path to the JSON configuration file for text cleanup rules.
+            config (dict, optional): Already parsed cleanup configuration. When given,
+                config_path is not read.
         """
-        self.pdf_path = pdf_path
-        self.doc_name = os.path.splitext(os.path.basename(pdf_path))[0]
         self.doc_output_folder = output_folder
         self._create_output_folder()
+        self.doc = None
+        self.reset(pdf_path)
+        if config is not None:
+            self.config = config
+            self._special_character_steps = self._compile_special_characters()
+            self._expression_patterns = self._compile_expressions()
+            self._texts_to_remove_pattern = self._compile_texts_to_remove()
+            self._clean_short_text = _short_text_cleaner(self._special_character_steps, self._expression_patterns)
+        else:
+            # Titles recur across documents, so the short text cache is shared by the
+            # extractors using the same configuration file
+            self.config = self._load_config(config_path)
+            (self._special_character_steps, self._expression_patterns,
+             self._texts_to_remove_pattern, self._clean_short_text) = self._get_compiled_config()
+
+    def reset(self, pdf_path):
+        """
+        Switches the extractor to another PDF file, keeping the output folder,
+        configuration and compiled cleanup patterns.
+
+        Args:
+            pdf_path (str): Path to the new PDF file.
+        """
+        # Drop the reference before closing, so an interruption (e.g. a timeout) cannot
+        # leave a closed document behind to be closed again on the next reset
+        doc, self.doc = self.doc, None
+        if doc is not None:
+            doc.close()
+        self.pdf_path = pdf_path
+        self.doc_name = os.path.splitext(os.path.basename(pdf_path))[0]
         self.doc = self._open_pdf()
-        self.config = self._load_config(config_path)
         self.processed_text = {}
+        self.json_output_path = None  # Set once the document's JSON output is saved
+        self._text_pages = None
+        self._clear_page_caches()
+
+        # Forget the previous document's TOC, so a failed extract_toc behaves as on a new instance
+        for name in ("toc", "formatted_toc", "no_numbering_flag"):
+            self.__dict__.pop(name, None)
+
+    def _clear_page_caches(self):
+        """Releases the extracted page text kept for the current document."""
+        self._page_text_cache = {}
+        self._content_clips = {}
+        self._clean_page_cache = {}
 
     import fitz  # PyMuPDF
 
@@ -68,26 +340,8 @@ class PDFExtractor:
         Returns:
             str: The concatenated raw text from all pages in the PDF.
         """
-        # Open the PDF document
-        try:
-            pdf_document = fitz.open(self.pdf_path)
-        except Exception as e:
-            raise FileNotFoundError(f"Error opening file {self.pdf_path}: {e}")
-
-        # Initialize an empty string to store all the text
-        all_text = ""
-
-        # Iterate over each page in the PDF
-        for page_num in range(len(pdf_document)):
-            # Access the current page
-            page = pdf_document[page_num]
-            # Extract text from the current page
-            all_text += page.get_text()  # Append the extracted text to the string
-            # Optionally, you could add page breaks here:
-            # all_text += "\n\n--- PAGE BREAK ---\n\n"
-
-        # Close the PDF document to free up resources
-        pdf_document.close()
+        # Concatenate the text of every page of the already opened document
+        all_text = "".join(self._get_page_text(page_num) for page_num in range(self.doc.page_count))
 
         # Cleaning text
         all_cleaning_text = self.clean_text(all_text)
@@ -110,6 +364,119 @@ class PDFExtractor:
         except Exception as e:
             raise FileNotFoundError(f"Failed to open PDF file: {e}")
 
+    def _page_has_text(self, page_num):
+        """
+        Checks whether a page can contain text.
+
+        Pages whose resources reference no font (e.g. scanned images) cannot hold
+        text. Only the resource dictionaries are read, so no content stream or
+        image is decoded.
+
+        Args:
+            page_num (int): 0-based page index.
+
+        Returns:
+            bool: False if the page has no font resources, True otherwise.
+        """
+        if self._text_pages is None:
+            self._text_pages = {
+                n for n in range(self.doc.page_count) if self.doc.get_page_fonts(n)
+            }
+        return page_num in self._text_pages
+
+    def _get_page_text(self, page_num, mode="text", margins=None):
+        """
+        Returns the text of a page, extracting it with PyMuPDF only once per document
+        for each mode and margins combination.
+
+        Args:
+            page_num (int): 0-based page index.
+            mode (str): Text extraction mode passed to page.get_text.
+            margins (tuple, optional): Header and footer heights to exclude from the
+                page. The full page is used when omitted.
+
+        Returns:
+            str: Extracted page text (empty for pages without text).
+        """
+        key = (page_num, mode, margins)
+        page_text = self._page_text_cache.get(key)
+        if page_text is None:
+            if self._page_has_text(page_num):
+                page = self.doc.load_page(page_num)
+                page_text = page.get_text(mode, clip=self._get_content_clip(page, margins))
+            else:
+                page_text = ""
+            self._page_text_cache[key] = page_text
+        return page_text
+
+    def _get_content_clip(self, page, margins):
+        """
+        Returns the content area of a page, reusing the area built for the previous
+        page of the same size.
+
+        Args:
+            page (fitz.Page): The page to clip.
+            margins (tuple, optional): Header and footer heights to exclude.
+
+        Returns:
+            fitz.Rect: The content area, or None to use the full page.
+        """
+        if margins is None:
+            return None
+        page_rect = page.rect
+        cached = self._content_clips.get(margins)
+        if cached is None or cached[0] != page_rect:
+            cached = (page_rect, _content_clip(page_rect, margins))
+            self._content_clips[margins] = cached
+        return cached[1]
+
+    def _prefetch_page_text(self, start, end, margins, num_workers):
+        """
+        Extracts the text of a range of pages in worker processes and stores it in
+        the page text cache. Does nothing for a single worker or a short range.
+
+        Args:
+            start (int): First 0-based page index.
+            end (int): Page index after the last page to extract.
+            margins (tuple, optional): Header and footer heights to exclude.
+            num_workers (int): Number of worker processes.
+        """
+        page_count = end - start
+        if num_workers <= 1 or page_count < _MIN_PAGES_FOR_PARALLEL_EXTRACTION:
+            return
+
+        # Split the pages into one contiguous chunk per worker
+        chunk_size = -(-page_count // num_workers)
+        starts = list(range(start, end, chunk_size))
+        ends = [min(chunk_start + chunk_size, end) for chunk_start in starts]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            chunks = executor.map(
+                _extract_page_range,
+                [self.pdf_path] * len(starts), starts, ends, [margins] * len(starts)
+            )
+            for chunk_start, page_texts in zip(starts, chunks):
+                for page_num, page_text in enumerate(page_texts, start=chunk_start):
+                    self._page_text_cache[(page_num, "text", margins)] = page_text
+
+    def _get_clean_page_text(self, page_num):
+        """
+        Returns the cleaned text of a page, extracting and cleaning it only once
+        per document.
+
+        Args:
+            page_num (int): 0-based page index.
+
+        Returns:
+            str: Cleaned page text (empty for pages without text).
+        """
+        page_text = self._clean_page_cache.get(page_num)
+        if page_text is None:
+            page_text = self._get_page_text(page_num)
+            page_text = self.clean_text(page_text) if page_text else ""
+            self._clean_page_cache[page_num] = page_text
+        return page_text
+
     def _load_config(self, config_path):
         """
         Loads a JSON configuration file for text cleanup rules.
@@ -120,13 +487,90 @@ class PDFExtractor:
         Returns:
             dict: Parsed configuration data.
         """
+        return load_config(config_path)
+
+    def _get_compiled_config(self):
+        """
+        Returns the compiled cleanup steps of a cached configuration, compiling them
+        only once per configuration file.
+
+        Returns:
+            tuple: The special character steps, the compiled expressions, the texts
+                to remove pattern and the memoized short text cleaner.
+        """
+        compiled = _COMPILED_CONFIG_CACHE.get(id(self.config))
+        if compiled is None or compiled[0] is not self.config:
+            special_character_steps = self._compile_special_characters()
+            expression_patterns = self._compile_expressions()
+            compiled = (
+                self.config, special_character_steps, expression_patterns, self._compile_texts_to_remove(),
+                _short_text_cleaner(special_character_steps, expression_patterns)
+            )
+            _COMPILED_CONFIG_CACHE[id(self.config)] = compiled
+        return compiled[1:]
+
+    def _compile_special_characters(self):
+        """
+        Prepares the removal of the "special_characters" listed in the configuration.
+
+        Consecutive single characters are merged into one str.translate deletion table,
+        so they are removed in a single pass. Longer strings are kept as they are and
+        removed with str.replace, preserving the configuration order.
+
+        Returns:
+            list: Translation tables (dict) and strings to remove, in configuration order.
+        """
+        steps = []
+        for chars in self.config.get("special_characters", []):
+            if not chars:
+                continue
+            if len(chars) > 1:
+                steps.append(chars)
+            elif steps and isinstance(steps[-1], dict):
+                steps[-1][ord(chars)] = None
+            else:
+                steps.append({ord(chars): None})
+        return steps
+
+    def _compile_expressions(self):
+        """
+        Compiles the regex substitutions listed under "expressions" in the configuration.
+
+        Returns:
+            list: Compiled patterns, in configuration order.
+        """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Configuration file not found at: {config_path}")
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON format in configuration file: {config_path}")
+            return [re.compile(expr) for expr in self.config.get("expressions", [])]
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression in configuration file: {e}")
+
+    def _compile_texts_to_remove(self):
+        """
+        Compiles the "texts_to_remove" listed in the configuration into one pattern,
+        so they are removed from a section in a single pass. Longer texts come first,
+        so a text containing another one is removed as a whole.
+
+        Returns:
+            re.Pattern: The compiled alternation, or None if there is nothing to remove.
+        """
+        texts = sorted({text for text in self.config.get("texts_to_remove", []) if text}, key=len, reverse=True)
+        if not texts:
+            return None
+        return re.compile("|".join(re.escape(text) for text in texts))
+
+    def remove_unwanted_texts(self, text):
+        """
+        Removes the "texts_to_remove" listed in the configuration from a text.
+
+        Args:
+            text (str): The text to clean.
+
+        Returns:
+            str: The text without the unwanted snippets, stripped.
+        """
+        if self._texts_to_remove_pattern is None:
+            return text
+        return self._texts_to_remove_pattern.sub("", text).strip()
 
     def clean_text(self, text):
         """
@@ -139,17 +583,13 @@ class PDFExtractor:
         Returns:
             str: Cleaned text.
         """
-        try:
-            for char in self.config.get("special_characters", []):
-                text = text.replace(char, "")
+        if isinstance(text, str) and len(text) <= _CLEAN_TEXT_CACHE_MAX_LENGTH:
+            return self._clean_short_text(text)
+        return self._clean_text(text)
 
-            for expr in self.config.get("expressions", []):
-                text = re.sub(expr, "", text)
-
-            text = re.sub(r"\s+", " ", text).strip()
-            return text
-        except Exception as e:
-            raise RuntimeError(f"Error during text cleaning: {e}")
+    def _clean_text(self, text):
+        """Applies the cleanup steps of clean_text without memoization."""
+        return _apply_text_cleanup(text, self._special_character_steps, self._expression_patterns)
 
     def clean_title_suffix(self, title):
         """
@@ -162,9 +602,7 @@ class PDFExtractor:
             str: Cleaned title.
         """
         try:
-            clean_pattern = re.compile(r"(.*?)([A-Z]+\s*|\d+\s*)*$")
-            match = clean_pattern.match(title)
-            return match.group(1).strip() if match else title
+            return _clean_title_suffix(title)
         except Exception as e:
             raise RuntimeError(f"Error during title suffix cleaning: {e}")
 
@@ -192,9 +630,6 @@ class PDFExtractor:
             self.formatted_toc = []
             self.no_numbering_flag = True  # Assume titles have no numbering initially
 
-            # Regex pattern to detect numbering formats (e.g., "1.", "1.1.", "1.1.1.")
-            numbering_pattern = re.compile(r"^\d+(\.\d+)*\.?\s")
-
             for item in self.toc:
                 level = item[0]  # Hierarchical level of the TOC entry
                 raw_title = item[1]  # Raw title from the TOC
@@ -203,7 +638,7 @@ class PDFExtractor:
                 cleaned_title = self.clean_text(raw_title)
 
                 # Check if the title contains numbering
-                if numbering_pattern.match(cleaned_title):
+                if _NUMBERED_TITLE_RE.match(cleaned_title):
                     self.no_numbering_flag = False
 
                 # Clean title suffix if no numbering is present
@@ -228,33 +663,22 @@ class PDFExtractor:
 
     def generate_title_variations(self, title):
         """
-        Generates variations of a title by combining different spacing and numbering patterns.
+        Builds regex patterns matching a title preceded by a numbering (e.g., "1.", "1.1.",
+        "1.1.1."), with or without spaces between its words.
 
         Args:
             title (str): The original title.
 
         Returns:
-            list: A list of possible variations for the title, including numbering patterns.
+            list: (numbering pattern, compiled case-insensitive pattern) pairs, one per
+                numbering format, deepest numbering first.
         """
         try:
-            words = title.split()
-            variations = []
-
-            # Generate all combinations of spaces between words
-            for space_combination in product([True, False], repeat=len(words) - 1):
-                new_title = words[0]
-                for i, keep_space in enumerate(space_combination):
-                    new_title += (" " if keep_space else "") + words[i + 1]
-                variations.append(new_title)
-
-            # Add numbering patterns (e.g., "1.", "1.1.", "1.1.1.") to each variation
-            for variation in variations[:]:  # Iterate over existing variations
-                for numbering_depth in range(1, 5):  # Generate up to four levels of numbering
-                    numbering = '.'.join(['\\d+'] * numbering_depth)
-                    numbered_variation = numbering + r'\s*' + re.escape(variation)
-                    variations.append(numbered_variation)
-
-            return variations
+            words = r"\s*".join(re.escape(word) for word in title.split())
+            return [
+                (numbering, re.compile(f"{numbering}\\s*{words}", re.IGNORECASE))
+                for numbering in _TITLE_NUMBERING_PATTERNS
+            ]
         except Exception as e:
             raise RuntimeError(f"Error generating title variations: {e}")
 
@@ -268,92 +692,105 @@ class PDFExtractor:
             processed_text (dict): Processed text sections for updating corresponding titles.
         """
         try:
-            # Define numbering patterns (e.g., "1.", "1.1.", "1.1.1.")
-            numbering_patterns = [
-                r"\d+", r"\d+\.", r"\d+\.\d+", r"\d+\.\d+\.", r"\d+\.\d+\.\d+",
-                r"\d+\.\d+\.\d+\.", r"\d+\.\d+\.\d+\.\d+"
-            ]
-
-            for i, toc_entry in enumerate(toc):
+            for toc_entry, next_entry in zip(toc, toc[1:] + [None]):
                 original_title = toc_entry["title"]
+                # Nothing to search for empty titles or titles that already carry numbering
+                if not original_title.strip() or _NUMBERED_TITLE_RE.match(original_title):
+                    continue
                 start_page = toc_entry["page"] - 1
-                end_page = toc[i + 1]["page"] - 1 if i + 1 < len(toc) else self.doc.page_count - 1
+                end_page = next_entry["page"] - 1 if next_entry else self.doc.page_count - 1
 
-                # Generate title variations
+                # One pattern per numbering format, each covering every word spacing of the title
                 title_variations = self.generate_title_variations(original_title)
                 found_match = False
 
-                for numbering in numbering_patterns:
-                    for title_variant in title_variations:
-                        pattern = f"{numbering}\\s*{title_variant}"
-
-                        # Search through pages in the range for a matching pattern
-                        for page_num in range(start_page, end_page + 1):
-                            page = self.doc.load_page(page_num)
-                            page_text = self.clean_text(page.get_text("text"))
-
-                            # Perform character-by-character search for the pattern
-                            match_position = -1
-                            for start_index in range(len(page_text)):
-                                if re.match(pattern, page_text[start_index:], re.IGNORECASE):
-                                    match_position = start_index
-                                    break
+                for numbering, title_pattern in title_variations:
+                    # Search through pages in the range for a matching pattern
+                    for page_num in range(start_page, end_page + 1):
+                        page_text = self._get_clean_page_text(page_num)
+                        match = title_pattern.search(page_text)
 
-                            if match_position != -1:
-                                # Extract the matched numbered title
-                                numbered_title = page_text[match_position:match_position + len(numbering) + len(title_variant)]
+                        if match:
+                            # Extract the numbered title. The slice spans the length of the numbering
+                            # pattern plus the title, reaching into any text glued after the title,
+                            # which process_string trims later.
+                            match_position = match.start()
+                            numbered_title = page_text[match_position:match_position + len(numbering) + len(original_title)]
 
-                                # Clean trailing uppercase or digit-only suffix if numbering is absent
-                                if self.no_numbering_flag:
-                                    numbered_title = self.clean_title_suffix(numbered_title)
+                            # Clean trailing uppercase or digit-only suffix if numbering is absent
+                            if self.no_numbering_flag:
+                                numbered_title = self.clean_title_suffix(numbered_title)
 
-                                # Update the TOC entry with the numbered title
-                                toc_entry["title"] = numbered_title
+                            # Update the TOC entry with the numbered title
+                            toc_entry["title"] = numbered_title
 
-                                # Update the processed_text dictionary with the new title
-                                if original_title in processed_text:
-                                    processed_text[numbered_title] = processed_text.pop(original_title)
+                            # Update the processed_text dictionary with the new title
+                            if original_title in processed_text:
+                                processed_text[numbered_title] = processed_text.pop(original_title)
 
-                                found_match = True
-                                break
-                        if found_match:
+                            found_match = True
                             break
+                    if found_match:
+                        break
         except Exception as e:
             raise RuntimeError(f"Error during search and replace of numbered titles: {e}")
 
 
-    def extract_raw_text(self):
+    def extract_raw_text(self, num_workers=1):
         """
         Extracts the raw text from the PDF while excluding headers and footers.
 
+        Args:
+            num_workers (int): Number of processes extracting pages in parallel.
+                Defaults to 1, as batch runs already process one PDF per worker.
+
         Returns:
             str: Concatenated text from all pages of the PDF.
         """
         try:
-            full_text = ""
             header_height = 50
             footer_height = 70
 
-            for page_num in range(self.doc.page_count):
-                page = self.doc.load_page(page_num)
-                page_rect = page.rect
+            self._prefetch_page_text(0, self.doc.page_count, (header_height, footer_height), num_workers)
 
-                # Define the main content area to exclude headers and footers
-                main_content_rect = fitz.Rect(
-                    page_rect.x0,
-                    page_rect.y0 + header_height,
-                    page_rect.x1,
-                    page_rect.y1 - footer_height
-                )
-
-                # Extract text from the content area
-                full_text += page.get_text("text", clip=main_content_rect) + "\n"
-
-            return full_text
+            # Extract text from the content area of each page, excluding headers and footers
+            return "".join(
+                self._get_page_text(page_num, margins=(header_height, footer_height)) + "\n"
+                for page_num in range(self.doc.page_count)
+            )
         except Exception as e:
             raise RuntimeError(f"Error extracting raw text: {e}")
 
 
+    def _find_in_pages(self, document_text, page_offsets, text, first_page, last_page):
+        """
+        Finds the first occurrence of a text contained in a single non-empty page of
+        a page range.
+
+        Args:
+            document_text (str): Page texts joined with a newline after each page.
+            page_offsets (list): Start offset of each page in document_text, followed
+                by the length of document_text.
+            text (str): The text to search for.
+            first_page (int): First 0-based page index of the range.
+            last_page (int): Last 0-based page index of the range.
+
+        Returns:
+            int: Offset of the occurrence in document_text, or -1 if not found.
+        """
+        if first_page > last_page:
+            return -1
+        range_end = page_offsets[last_page + 1]
+        position = document_text.find(text, page_offsets[first_page], range_end)
+        while 0 <= position < range_end:
+            page_num = bisect.bisect_right(page_offsets, position) - 1
+            page_start, page_end = page_offsets[page_num], page_offsets[page_num + 1] - 1
+            # Skip empty pages and matches running into the newline after a page
+            if page_end > page_start and position + len(text) <= page_end:
+                return position
+            position = document_text.find(text, position + 1, range_end)
+        return -1
+
     def structure_raw_text_by_toc_no_numbering(self):
         """
         Structures raw text into sections based on TOC when numbering is absent.
@@ -364,114 +801,94 @@ class PDFExtractor:
         try:
             sections = {}
             toc = self.formatted_toc
-            self.texts_to_remove = self.config.get("texts_to_remove", [])
 
-            # Regex to remove trailing number chains directly attached to titles
-            trailing_number_pattern = re.compile(r"(.*?)(\d+(\.\d+)*\.)$")
+            # Join the cleaned pages once, each followed by a newline, and record where
+            # each page starts so sections can be sliced out of the whole document
+            page_texts = [self._get_clean_page_text(page_num) for page_num in range(self.doc.page_count)]
+            document_text = "".join(page_text + "\n" for page_text in page_texts)
+            page_offsets = [0]
+            for page_text in page_texts:
+                page_offsets.append(page_offsets[-1] + len(page_text) + 1)
 
-            header_height = 50
-            footer_height = 70
-
-            for i, toc_entry in enumerate(toc):
+            last_page = self.doc.page_count - 1
+            for toc_entry, next_entry in zip(toc, toc[1:] + [None]):
                 title = toc_entry["title"]
 
                 # Clean trailing number chains from the title
-                match = trailing_number_pattern.match(title)
+                match = _TRAILING_NUMBERING_RE.match(title)
                 if match:
                     title = match.group(1).strip()
 
-                start_page = toc_entry["page"] - 1
-                end_page = toc[i + 1]["page"] - 1 if i + 1 < len(toc) else self.doc.page_count - 1
-
-                section_text = ""
-                start_found = False
-                end_position = None
-
-                for page_num in range(start_page, end_page + 1):
-                    page = self.doc.load_page(page_num)
-                    page_text = self.clean_text(page.get_text("text"))
-
-                    # Find the start of the section
-                    if not start_found:
-                        for start_index in range(len(page_text)):
-                            if page_text[start_index:].startswith(title):
-                                start_position = start_index
-                                start_found = True
-                                break
-                        if start_found:
-                            section_text += page_text[start_position:] + "\n"
-                        continue
-
-                    # Find the end of the section
-                    if start_found and i + 1 < len(toc):
-                        next_title = toc[i + 1]["title"]
-                        for end_index in range(len(page_text)):
-                            if page_text[end_index:].startswith(next_title):
-                                end_position = end_index
-                                break
-                        if end_position is not None:
-                            section_text += page_text[:end_position]
-                            break
+                start_page = max(toc_entry["page"] - 1, 0)
+                end_page = min(next_entry["page"] - 1, last_page) if next_entry else last_page
 
-                    # Add full page text if within the section
-                    if start_found and end_position is None:
-                        section_text += page_text + "\n"
+                # Find the start of the section on the first page of the range holding the title
+                start_position = self._find_in_pages(document_text, page_offsets, title, start_page, end_page)
+                if start_position == -1:
+                    section_text = ""
+                else:
+                    # The section ends before the next title on a following page, or with the range
+                    section_end = page_offsets[end_page + 1]
+                    if next_entry:
+                        title_page = bisect.bisect_right(page_offsets, start_position) - 1
+                        next_position = self._find_in_pages(
+                            document_text, page_offsets, next_entry["title"], title_page + 1, end_page
+                        )
+                        if next_position != -1:
+                            section_end = next_position
+                    section_text = document_text[start_position:section_end]
 
                 # Remove unwanted text snippets
-                for text_to_remove in self.texts_to_remove:
-                    section_text = section_text.replace(text_to_remove, "").strip()
+                section_text = self.remove_unwanted_texts(section_text)
 
-                sections[title] = self.clean_text(section_text)
+                # The pages are already cleaned, but the page separators and the gaps left
+                # by the removed snippets still need the section-level cleaning
+                sections[title] = self.clean_text(section_text) if section_text else ""
 
             return sections
         except Exception as e:
             raise RuntimeError(f"Error structuring raw text by TOC: {e}")
 
 
-    def structure_raw_text_by_toc(self):
+    def structure_raw_text_by_toc(self, num_workers=1):
         """
         Structures the raw text from the PDF into sections based on the Table of Contents (TOC).
 
         This method uses the TOC to determine the boundaries of each section and extracts text
         from the corresponding pages, excluding headers and footers.
 
+        Args:
+            num_workers (int): Number of processes extracting pages in parallel.
+                Defaults to 1, as batch runs already process one PDF per worker.
+
         Returns:
             dict: A dictionary with TOC titles as keys and the corresponding cleaned text as values.
         """
         try:
             sections = {}
             toc = self.extract_toc()  # Extract the TOC to define section boundaries
-            self.texts_to_remove = self.config.get("texts_to_remove", [])  # Load any unwanted text markers to remove
 
             # Define the heights to exclude headers and footers during text extraction
             header_height = 50
             footer_height = 70
 
-            for i, entry in enumerate(toc):
+            if toc:
+                first_page = max(0, min(entry["page"] for entry in toc) - 1)
+                self._prefetch_page_text(first_page, self.doc.page_count, (header_height, footer_height), num_workers)
+
+            for entry, next_entry in zip(toc, toc[1:] + [None]):
                 title = entry["title"]
                 start_page = entry["page"] - 1  # Convert page number to 0-based index
-                end_page = toc[i + 1]["page"] - 1 if i + 1 < len(toc) else self.doc.page_count - 1  # Determine the last page
-
-                section_text = ""
-                for page_num in range(start_page, end_page + 1):
-                    # Load the current page
-                    page = self.doc.load_page(page_num)
-                    page_rect = page.rect
-
-                    # Define the content area excluding headers and footers
-                    main_content_rect = fitz.Rect(
-                        page_rect.x0,
-                        page_rect.y0 + header_height,
-                        page_rect.x1,
-                        page_rect.y1 - footer_height
-                    )
+                end_page = next_entry["page"] - 1 if next_entry else self.doc.page_count - 1  # Determine the last page
 
-                    # Extract text from the defined content area
-                    section_text += page.get_text("text", clip=main_content_rect) + "\n"
+                # Extract text from the content area of each page, excluding headers and footers
+                section_text = "".join(
+                    self._get_page_text(page_num, margins=(header_height, footer_height)) + "\n"
+                    for page_num in range(start_page, end_page + 1)
+                )
 
                 # Remove unwanted texts specified in the configuration
-                for text_to_remove in self.texts_to_remove:
-                    section_text = section_text.replace(text_to_remove, "").strip()
+                section_text = self.remove_unwanted_texts(section_text)
 
                 # Clean and normalize the section text
                 sections[title] = self.clean_text(section_text)
@@ -481,6 +898,24 @@ class PDFExtractor:
             raise RuntimeError(f"Error while structuring raw text by TOC: {e}")
         
     
+    def _modify_title(self, title):
+        """
+        Returns the form a title takes in the extracted text: level 1 titles lose their
+        numbering and sub-level numberings are followed by a space.
+
+        Args:
+            title (str): The TOC title.
+
+        Returns:
+            str: The title as searched for in the section text.
+        """
+        match = _TITLE_LEVEL_RE.match(title)
+        if match is None or match.lastgroup == "level3":
+            return title  # Keep unchanged if spaced level 3 or no specific match
+        if match.lastgroup == "level2":
+            return _SUBLEVEL_NUMBERING_RE.sub(r"\1 ", title).strip()
+        return title[match.start("level1"):].lstrip()  # Remove numbering to get the plain title
+
     def extract_sections_from_processed_text(self, titles, processed_text):
         """
         Extracts sections of text based on TOC titles and their boundaries in the processed text.
@@ -495,17 +930,12 @@ class PDFExtractor:
         try:
             sectioned_text = {}
 
-            for i, title in enumerate(titles):
-                # Determine the modified version of the current title
-                if re.match(r"^\d+\.\d+\.\d+\.\s+.+", title):
-                    modified_title = title
-                elif re.match(r"^\d+\.\d+\..+", title) or re.match(r"^\d+\.\d+\.\d+\..+", title):
-                    modified_title = re.sub(r"((\d+\.){2,3})", r"\1 ", title).strip()
-                elif re.match(r"^\d+\..+", title):
-                    modified_title = re.sub(r"^\d+\.\s*", "", title)  # Remove numbering to get the plain title
-                else:
-                    modified_title = title  # Keep unchanged if no specific match
+            # Transform every title once; each one is used as both current and next title
+            modified_titles = [self._modify_title(title) for title in titles]
 
+            for title, modified_title, next_title, modified_next_title in zip(
+                titles, modified_titles, titles[1:] + [None], modified_titles[1:] + [None]
+            ):
                 # Get the raw text corresponding to the current title
                 current_text = processed_text.get(title, "")
                 if not current_text:
@@ -514,26 +944,14 @@ class PDFExtractor:
 
                 section_text = current_text
 
-                # Identify the next title for the end boundary of the current section
-                if i + 1 < len(titles):
-                    next_title = titles[i + 1]
-
-                    # Transform the next title similarly to the current title
-                    if re.match(r"^\d+\.\d+\.\d+\.\s+.+", next_title):
-                        modified_next_title = next_title
-                    elif re.match(r"^\d+\.\d+\..+", next_title) or re.match(r"^\d+\.\d+\.\d+\..+", next_title):
-                        modified_next_title = re.sub(r"((\d+\.){2,3})", r"\1 ", next_title).strip()
-                    elif re.match(r"^\d+\..+", next_title):
-                        modified_next_title = re.sub(r"^\d+\.\s*", "", next_title)
-                    else:
-                        modified_next_title = next_title
-
+                # Use the next title for the end boundary of the current section
+                if next_title is not None:
                     # Find the start index of the current section
                     start_index = current_text.find(modified_title)
                     if start_index == -1:  # Fallback to use the original title
                         start_index = current_text.find(title)
-                    if start_index == -1 and re.match(r"^\d+\.\s*.+", title):  # Fallback to plain title
-                        stripped_title = re.sub(r"^\d+\.\s*", "", title)
+                    if start_index == -1 and _LEVEL1_PLAIN_TITLE_RE.match(title):  # Fallback to plain title
+                        stripped_title = _LEVEL1_NUMBERING_RE.sub("", title)
                         start_index = current_text.find(stripped_title)
 
                     # Find the end index using the next title
@@ -579,13 +997,13 @@ class PDFExtractor:
                     text = text[len(title):].strip()
 
                 # 2. Check if the section text length is too short after removing numbering
-                stripped_title = re.sub(r"\d+[\.\s]*", "", title).strip()  # Remove numbering from the title
-                stripped_text = re.sub(r"\d+[\.\s]*", "", text).strip()  # Remove numbering from the text
+                stripped_title = _NUMBERING_CHUNK_RE.sub("", title).strip()  # Remove numbering from the title
+                stripped_text = _NUMBERING_CHUNK_RE.sub("", text).strip()  # Remove numbering from the text
                 if len(stripped_text) <= 50:  # Threshold for considering text too short
                     text = ""
 
                 # 3. Handle cases where numbering is attached to the title
-                numbering_pattern = re.match(r"^(\d+(\.\d+)*\.)", title)  # Matches numbering like "1.", "1.1."
+                numbering_pattern = _NUMBERING_PREFIX_RE.match(title)  # Matches numbering like "1.", "1.1."
                 if numbering_pattern:
                     numbering = numbering_pattern.group(0)  # Extract the numbering (e.g., "1.1.")
                     expected_start = f"{numbering} {stripped_title}"  # Form the expected start of the section text
@@ -614,7 +1032,7 @@ class PDFExtractor:
 
             for key, value in input_dict.items():
                 # Regex to match and separate numbering and title
-                match = re.match(r'^(\d+(\.\d+)*)(\.?)(\s*)(.*)', key)
+                match = _KEY_NUMBERING_RE.match(key)
                 if match:
                     # Extract numbering and title
                     numbering = match.group(1)  # Group 1 contains the numbering (e.g., "1", "1.1")
@@ -634,7 +1052,7 @@ class PDFExtractor:
 
     def process_string(self,input_string):
         # Separate numbering from the text
-        match = re.match(r"^(\d+(?:\.\d+)*\.*)(.*)$", input_string)
+        match = _STRING_NUMBERING_RE.match(input_string)
         if not match:
             return input_string
         else:            
@@ -642,17 +1060,18 @@ class PDFExtractor:
             numbering = numbering.strip()
             text = text.strip()
 
-            # Find the last uppercase letter from the end
-            for i in range(len(text) - 1, -1, -1):
-                if text[i].isupper():
-                    # If the uppercase letter is the last character, do nothing
-                    if i == 0:
-                        break
-                    # Check the next character (if exists)
-                    if i + 1 < len(text) and text[i + 1] != " ":
-                        # Remove from the end to this uppercase letter
-                        text = text[:i]
-                    break
+            # Find the last uppercase letter from the end; ASCII text is scanned by
+            # a regex, other text keeps the str.isupper check
+            if text.isascii():
+                last_upper = _LAST_UPPER_RE.search(text)
+                i = last_upper.start() if last_upper else -1
+            else:
+                i = next((i for i in range(len(text) - 1, -1, -1) if text[i].isupper()), -1)
+
+            # If the uppercase letter is the first character, do nothing; otherwise
+            # remove from this letter to the end unless a space follows it
+            if i > 0 and i + 1 < len(text) and text[i + 1] != " ":
+                text = text[:i]
             
             # Reconstruct the result
             result = f"{numbering} {text}"
@@ -679,214 +1098,201 @@ class PDFExtractor:
             RuntimeError: If any error occurs during the processing of titles.
         """
         try:
-            # Step 1: Extract numbering from input_list
-            numbering_list = []
-            for item in input_list:
-                title = item.get("title", "")
-                # Match numbering patterns like "1.", "1.1", etc.
-                match = re.match(r"^(\d+(\.\d+)*)", title)
-                if match:
-                    numbering = match.group(1)  # Extract the numbering
-                    if not numbering.endswith("."):
-                        numbering += "."  # Ensure numbering ends with a dot
-                    numbering_list.append(numbering)
-                else:
-                    numbering_list.append("")  # No numbering found, add an empty string
+            updated_dict = {}
+            for item, (title, text) in zip(input_list, original_dict.items()):
+                # Extract numbering patterns like "1.", "1.1", etc. from the TOC entry
+                match = _LEADING_NUMBERING_RE.match(item.get("title", ""))
+                numbering = match.group(1) if match else ""
+                if numbering and not numbering.endswith("."):
+                    numbering += "."  # Ensure numbering ends with a dot
 
-            # Step 2: Extract plain text from original_dict titles
-            text_list = []
-            for title in original_dict.keys():
-                # Match titles with optional numbering followed by the actual text
-                match = re.match(r"^\s*(\d+(\.\d+)*\.?\s*)?(.*)", title)
-                if match:
-                    text = match.group(3).strip()  # Extract and clean the actual text
-                    text_list.append(text if text else "")  # Add text or an empty string
-                else:
-                    text_list.append("")  # Add an empty string if no match is found
-
-            # Step 3: Reconstruct titles by combining numbering and text
-            reconstructed_titles = []
-            for numbering, text in zip(numbering_list, text_list):
-                if numbering:
-                    reconstructed_titles.append(f"{numbering} {text}".strip())  # Merge numbering and text
-                else:
-                    reconstructed_titles.append(text)  # Use text alone if numbering is absent
+                # Extract the plain text of the original title, dropping any numbering
+                plain_title = _OPTIONAL_NUMBERING_TITLE_RE.match(title).group(3).strip()
 
-            # Step 4: Replace original titles with reconstructed titles in the dictionary
-            updated_dict = {new_title: text for new_title, text in zip(reconstructed_titles, original_dict.values())}
+                # Reconstruct the title by combining numbering and text
+                new_title = f"{numbering} {plain_title}".strip() if numbering else plain_title
+                updated_dict[new_title] = text
 
             return updated_dict
         except Exception as e:
             raise RuntimeError(f"Error processing titles in one step: {e}")
 
     
-    def find_and_replace_numberings(self, data):
+    def _reconstruct_numberings(self, numberings):
         """
-        Identifies non-logical numbering suites, reconstructs numbering where necessary, 
-        and updates the input dictionary with corrected titles.
+        Identifies non-logical numbering suites in a sequence of title numberings and
+        reconstructs them from the adjacent valid numberings.
 
         Args:
-            data (dict): A dictionary where keys are titles potentially starting with numberings
-                        (e.g., "1. Introduction") and values are associated content.
+            numberings (list): The numbering of each title (e.g., "1.2."), or an empty
+                string for titles without numbering.
 
         Returns:
-            dict: A dictionary with updated titles containing corrected numbering.
+            list: The corrected numbering of each title, or an empty string for titles
+                without numbering.
 
         Raises:
-            ValueError: If the input data is not a dictionary.
-            TypeError: If keys in the dictionary are not strings.
+            ValueError: If a numbering cannot be parsed.
         """
 
-        def generate_next_numberings(current_numbering):
+        def parse_numbering(numbering):
             """
-            Generate all possible logical numbering sequences following the given numbering.
-            Dynamically expands sub-levels, sibling levels, and higher levels.
+            Parse a numbering string into its integer parts.
 
             Args:
-                current_numbering (str): The current numbering string (e.g., "1.2.3.").
+                numbering (str): The numbering string (e.g., "1.2.3.").
 
             Returns:
-                list: A sorted list of possible logical next numberings.
+                list: The integer parts of the numbering (e.g., [1, 2, 3]).
             """
             try:
-                # Parse the current numbering into a list of integers
-                parts = list(map(int, current_numbering.strip('.').split('.')))
+                return list(map(int, numbering.strip('.').split('.')))
             except ValueError:
-                raise ValueError(f"Invalid numbering format: {current_numbering}")
-
-            possibilities = []
-
-            # Increment the last number in the current numbering
-            incremented = parts[:-1] + [parts[-1] + 1]
-            possibilities.append('.'.join(map(str, incremented)) + '.')
-
-            # Add new sub-levels dynamically
-            if len(parts) < 4:
-                for x in range(1, 10):
-                    sub_level = parts + [x]
-                    possibilities.append('.'.join(map(str, sub_level)) + '.')
-                    if len(sub_level) < 4:
-                        for y in range(1, 10):
-                            nested_sub_level = sub_level + [y]
-                            possibilities.append('.'.join(map(str, nested_sub_level)) + '.')
-
-            # Generate sibling levels
-            for x in range(parts[-1] + 1, parts[-1] + 10):
-                sibling_level = parts[:-1] + [x]
-                possibilities.append('.'.join(map(str, sibling_level)) + '.')
-                if len(sibling_level) < 4:
-                    for y in range(1, 10):
-                        sibling_sub_level = sibling_level + [y]
-                        possibilities.append('.'.join(map(str, sibling_sub_level)) + '.')
-
-            # Increment higher levels
-            for i in range(len(parts) - 1):
-                for x in range(1, 10):
-                    higher_level = parts[:i + 1] + [parts[i + 1] + x]
-                    possibilities.append('.'.join(map(str, higher_level)) + '.')
-
-            # Increment the top-level number
-            top_level_increment = [parts[0] + 1]
-            possibilities.append('.'.join(map(str, top_level_increment)) + '.')
+                raise ValueError(f"Invalid numbering format: {numbering}")
 
-            return sorted(set(possibilities))
-
-        # Input validation
-        if not isinstance(data, dict):
-            raise ValueError("Input data must be a dictionary.")
-        if any(not isinstance(key, str) for key in data.keys()):
-            raise TypeError("All keys in the dictionary must be strings.")
-
-        # Extract numberings from dictionary keys
-        numberings = []
-        blank_indexes = []  # Indices of titles without numberings
-        for idx, key in enumerate(data.keys()):
-            parts = key.split(' ', 1)
-            if parts[0].replace('.', '').isdigit():
-                numberings.append(parts[0])
-            else:
-                numberings.append("")
-                blank_indexes.append(idx)
+        def parse_logical_candidate(numbering):
+            """
+            Parse a numbering that may follow another one. Only canonical numberings
+            ("1.", "2.1.", ...: no leading zeros, ending with a dot) can be logical.
 
-        non_logical_indexes = []
-        i = 0
+            Args:
+                numbering (str): The numbering string.
 
-        while i < len(numberings) - 1:
-            current_numbering = numberings[i]
-            if current_numbering == "":
-                i += 1  # Skip blank entries
-                continue
+            Returns:
+                tuple: The integer parts of the numbering, or None if it is not canonical.
+            """
+            if not numbering.endswith('.'):
+                return None
+            parts = numbering[:-1].split('.')
+            if not all(part.isascii() and part.isdigit() and str(int(part)) == part for part in parts):
+                return None
+            return tuple(map(int, parts))
+
+        def is_logical_successor(current_parts, next_parts):
+            """
+            Check whether a numbering logically follows the current one: an incremented
+            or later sibling (optionally with a first sub-level), one or two new
+            sub-levels, an incremented higher level, or the next top-level number.
 
-            logical_found = False
-            j = i + 1
-            while j < len(numberings):
-                next_numbering = numberings[j]
-                if next_numbering == "":
-                    j += 1  # Skip blank entries
-                    continue
+            Args:
+                current_parts (list): The integer parts of the current numbering.
+                next_parts (tuple): The integer parts of the candidate next numbering.
 
-                # Generate logical possibilities from the current numbering
-                generated_next_numberings = generate_next_numberings(current_numbering)
+            Returns:
+                bool: True if the candidate is a logical next numbering.
+            """
+            depth = len(current_parts)
+            next_depth = len(next_parts)
+            last = current_parts[-1]
+
+            # Increment the last number, possibly adding a first sub-level
+            if next_depth in (depth, depth + 1) and list(next_parts[:depth - 1]) == current_parts[:-1]:
+                if last + 1 <= next_parts[depth - 1] <= last + 9:
+                    if next_depth == depth or (depth < 4 and 1 <= next_parts[depth] <= 9):
+                        return True
+
+            # Add one or two new sub-levels
+            if next_depth > depth and list(next_parts[:depth]) == current_parts:
+                if (next_depth == depth + 1 and depth < 4) or (next_depth == depth + 2 and depth < 3):
+                    if all(1 <= x <= 9 for x in next_parts[depth:]):
+                        return True
+
+            # Increment a higher level
+            if 2 <= next_depth <= depth and list(next_parts[:next_depth - 1]) == current_parts[:next_depth - 1]:
+                if current_parts[next_depth - 1] + 1 <= next_parts[-1] <= current_parts[next_depth - 1] + 9:
+                    return True
 
-                if next_numbering not in generated_next_numberings:
-                    non_logical_indexes.append(j)
-                    j += 1
-                else:
-                    logical_found = True
-                    i = j - 1  # Update i to the last logical point
+            # Increment the top-level number
+            return next_parts == (current_parts[0] + 1,)
+
+        # Parse every numbering once as a potential logical next numbering, and
+        # walk only the entries that have a numbering
+        candidate_parts = [parse_logical_candidate(numbering) if numbering else None for numbering in numberings]
+        numbered_indexes = [idx for idx, numbering in enumerate(numberings) if numbering]
+
+        # Positions (within numbered_indexes) of the non-logical numberings. The scan only
+        # moves forward, so they are recorded once each and in increasing order
+        non_logical_positions = []
+        current = 0
+
+        while current < len(numbered_indexes) - 1:
+            current_parts = parse_numbering(numberings[numbered_indexes[current]])
+
+            # Scan forward until a numbering logically follows the current one
+            for following in range(current + 1, len(numbered_indexes)):
+                next_parts = candidate_parts[numbered_indexes[following]]
+                if next_parts is not None and is_logical_successor(current_parts, next_parts):
+                    current = following  # Continue from the last logical point
                     break
-
-            if not logical_found:
+                non_logical_positions.append(following)
+            else:
                 break
-            i += 1
 
-        # Deduplicate non-logical indexes
-        non_logical_indexes = sorted(set(non_logical_indexes))
-
-        # Reconstruct non-logical numberings
+        # Reconstruct non-logical numberings. Numbered entries stay numbered, so the
+        # closest valid numberings of an entry are its neighbours among the numbered ones
         reconstructed_numberings = numberings[:]
-        for idx in non_logical_indexes:
-            prev_valid = None
-            next_valid = None
-
-            # Find the previous valid numbering
-            for i in range(idx - 1, -1, -1):
-                if reconstructed_numberings[i] != "":
-                    prev_valid = reconstructed_numberings[i]
-                    break
+        for position in non_logical_positions:
+            idx = numbered_indexes[position]
 
-            # Find the next valid numbering
-            for i in range(idx + 1, len(reconstructed_numberings)):
-                if reconstructed_numberings[i] != "":
-                    next_valid = reconstructed_numberings[i]
-                    break
+            # Find the previous and next valid numberings
+            prev_valid = reconstructed_numberings[numbered_indexes[position - 1]] if position > 0 else None
+            next_valid = (
+                reconstructed_numberings[numbered_indexes[position + 1]]
+                if position + 1 < len(numbered_indexes) else None
+            )
 
             # Reconstruct based on adjacent valid numberings
             if prev_valid and next_valid:
-                prev_parts = list(map(int, prev_valid.strip('.').split('.')))
-                next_parts = list(map(int, next_valid.strip('.').split('.')))
+                prev_parts = tuple(map(int, prev_valid.strip('.').split('.')))
+                next_parts = tuple(map(int, next_valid.strip('.').split('.')))
 
                 if len(prev_parts) == 1 and next_parts[0] == prev_parts[0]:
-                    sub_level = prev_parts + [1] if len(prev_parts) < 4 else prev_parts[:-1] + [prev_parts[-1] + 1]
-                    reconstructed_numberings[idx] = '.'.join(map(str, sub_level)) + '.'
+                    sub_level = prev_parts + (1,) if len(prev_parts) < 4 else prev_parts[:-1] + (prev_parts[-1] + 1,)
+                    reconstructed_numberings[idx] = _format_numbering(sub_level)
                 elif len(prev_parts) == len(next_parts) and prev_parts[:-1] == next_parts[:-1]:
-                    reconstructed_numberings[idx] = '.'.join(map(str, prev_parts[:-1] + [prev_parts[-1] + 1])) + '.'
+                    reconstructed_numberings[idx] = _format_numbering(prev_parts[:-1] + (prev_parts[-1] + 1,))
                 else:
-                    next_sibling = prev_parts[:-1] + [prev_parts[-1] + 1]
-                    reconstructed_numberings[idx] = '.'.join(map(str, next_sibling)) + '.'
+                    next_sibling = prev_parts[:-1] + (prev_parts[-1] + 1,)
+                    reconstructed_numberings[idx] = _format_numbering(next_sibling)
+
+        return reconstructed_numberings
+
+    def find_and_replace_numberings(self, data):
+        """
+        Identifies non-logical numbering suites, reconstructs numbering where necessary, 
+        and updates the input dictionary with corrected titles.
+
+        Args:
+            data (dict): A dictionary where keys are titles potentially starting with numberings
+                        (e.g., "1. Introduction") and values are associated content.
+
+        Returns:
+            dict: A dictionary with updated titles containing corrected numbering.
+
+        Raises:
+            ValueError: If the input data is not a dictionary.
+            TypeError: If keys in the dictionary are not strings.
+        """
+
+        # Input validation
+        if not isinstance(data, dict):
+            raise ValueError("Input data must be a dictionary.")
+        if any(not isinstance(key, str) for key in data.keys()):
+            raise TypeError("All keys in the dictionary must be strings.")
+
+        # Split every title once and keep its text for rebuilding the corrected title
+        split_titles = [_split_title_numbering(key) for key in data]
+        reconstructed_numberings = self._reconstruct_numberings([numbering for numbering, _ in split_titles])
 
         # Update dictionary with corrected titles
         updated_dict = {}
-        for idx, (key, value) in enumerate(data.items()):
-            if idx in blank_indexes:
+        for (key, value), (_, tail), new_numbering in zip(data.items(), split_titles, reconstructed_numberings):
+            if not new_numbering:
                 updated_dict[key] = value  # Retain blank titles
+            elif tail is not None:
+                updated_dict[new_numbering + " " + tail] = value
             else:
-                parts = key.split(' ', 1)
-                new_numbering = reconstructed_numberings[idx]
-                if len(parts) > 1:
-                    updated_dict[new_numbering + " " + parts[1]] = value
-                else:
-                    updated_dict[new_numbering] = value
+                updated_dict[new_numbering] = value
 
         return updated_dict
 
@@ -904,59 +1310,69 @@ class PDFExtractor:
         Raises:
             ValueError: If the input is not a dictionary or if any key is not a string.
         """
-        import re
 
-        def remove_numbering(title):
-            """
-            Remove numbering (e.g., '1.', '1.1.', etc.) from the title.
+        # Validate input
+        if not isinstance(input_dict, dict):
+            raise ValueError("Input must be a dictionary with title:text pairs.")
+        if any(not isinstance(k, str) or not isinstance(v, str) for k, v in input_dict.items()):
+            raise ValueError("All keys and values in the dictionary must be strings.")
 
-            Args:
-                title (str): The title from which numbering should be removed.
+        # Process each title:text pair
+        result_dict = {}
+        for title, text in input_dict.items():
+            result_dict[title] = self._remove_title(title, text)
 
-            Returns:
-                str: The title without numbering.
-            """
-            if not isinstance(title, str):
-                raise ValueError(f"Title must be a string. Got {type(title)}.")
-            return re.sub(r'^\d+(\.\d+)*\.\s*', '', title).strip()
+        return result_dict
 
-        def find_and_remove(text, title):
-            """
-            Find the first occurrence of the title in the text and remove everything 
-            up to and including the matched title.
+    def _remove_title(self, title, text):
+        """
+        Remove numbering from a title, find its first occurrence in the text and remove
+        everything up to and including the matched title.
 
-            Args:
-                text (str): The text to search within.
-                title (str): The title to find and remove.
+        Args:
+            title (str): The title, possibly starting with a numbering.
+            text (str): The text to search within.
 
-            Returns:
-                str: Updated text with the matched title and preceding content removed.
+        Returns:
+            str: Updated text with the matched title and preceding content removed,
+                or the text unchanged if the title is not found.
+        """
+        clean_title = _TITLE_NUMBERING_STRIP_RE.sub('', title).strip()
+        index = text.find(clean_title)
+        if index != -1:
+            return text[index + len(clean_title):].lstrip()
+        return text
 
-            Raises:
-                ValueError: If text or title is not a string.
-            """
-            if not isinstance(text, str) or not isinstance(title, str):
-                raise ValueError("Both text and title must be strings.")
-            
-            # Iterate character by character to find the first exact match of the title
-            for i in range(len(text) - len(title) + 1):
-                if text[i:i + len(title)] == title:
-                    # Remove everything up to and including the title
-                    return text[i + len(title):].lstrip()
-            return text  # Return text unchanged if no match is found
+    def _normalize_renumber_strip(self, data):
+        """
+        Normalizes the title numberings, reconstructs non-logical numberings and removes
+        each title from its text in a single step. Equivalent to chaining
+        normalize_keys_with_numbering, find_and_replace_numberings and remove_title_from_text,
+        but builds the final dictionary only once.
 
-        # Validate input
-        if not isinstance(input_dict, dict):
-            raise ValueError("Input must be a dictionary with title:text pairs.")
-        if any(not isinstance(k, str) or not isinstance(v, str) for k, v in input_dict.items()):
+        Args:
+            data (dict): A dictionary with title:text pairs.
+
+        Returns:
+            dict: A new dictionary with corrected titles and the titles removed from the texts.
+
+        Raises:
+            ValueError: If any value in the dictionary is not a string.
+        """
+        # Normalized titles may collide, so they are deduplicated in a dictionary first
+        normalized_dict = self.normalize_keys_with_numbering(data)
+        if any(not isinstance(value, str) for value in normalized_dict.values()):
             raise ValueError("All keys and values in the dictionary must be strings.")
 
-        # Process each title:text pair
+        split_titles = [_split_title_numbering(key) for key in normalized_dict]
+        reconstructed_numberings = self._reconstruct_numberings([numbering for numbering, _ in split_titles])
+
         result_dict = {}
-        for title, text in input_dict.items():
-            clean_title = remove_numbering(title)
-            updated_text = find_and_remove(text, clean_title)
-            result_dict[title] = updated_text
+        for (key, value), (_, tail), new_numbering in zip(normalized_dict.items(), split_titles,
+                                                          reconstructed_numberings):
+            if new_numbering:
+                key = new_numbering + " " + tail if tail is not None else new_numbering
+            result_dict[key] = self._remove_title(key, value)
 
         return result_dict
     
@@ -969,70 +1385,95 @@ class PDFExtractor:
             input_dict (dict): A dictionary with titles and their associated content.
 
         Returns:
-            dict: A nested dictionary organized by levels, with grouped sub-levels.
+            dict: A nested dictionary organized by levels, with grouped sub-levels. Keys are
+                (level, parent numbering) tuples: (0, None) for unnumbered titles, (1, "")
+                for top-level titles and e.g. (3, "2.1") for the sub-levels of "2.1.".
         """
-        organized = defaultdict(dict)  # Dictionary to hold organized levels
+        organized = {}  # Dictionary to hold organized levels
         unnumbered = {}
 
-        # Regex to extract numbering prefix
-        numbering_pattern = re.compile(r'^(\d+(\.\d+)*\.)')  # Matches "X.", "X.X.", "X.X.X." at the start of a title
-
         for title, content in input_dict.items():
-            # Match the numbering prefix
-            match = numbering_pattern.match(title)
+            # Intern the title so the keys of the leveled output share one string per title
+            title = sys.intern(title)
+
+            # Match the numbering prefix ("X.", "X.X.", "X.X.X." at the start of a title)
+            match = _NUMBERING_PREFIX_RE.match(title)
 
             if match:
-                # Extract the numbering prefix
-                numbering = match.group(1).rstrip('.')  # e.g., "1", "2.1", "3.2.1"
-                parent_numbering = '.'.join(numbering.split('.')[:-1])  # Determine the parent numbering
+                # Extract the numbering prefix and its parent numbering
+                numbering = match.group(1)  # e.g., "1", "2.1", "3.2.1"
+                last_dot = numbering.rfind('.')
+                parent_numbering = numbering[:last_dot] if last_dot >= 0 else ""
                 
                 if parent_numbering:
                     # Group under the parent level
-                    parent_level = numbering.count('.') + 1
-                    level_key = f"level {parent_level} for {parent_numbering}"
-                    organized[level_key][title] = content
+                    level_key = (numbering.count('.') + 1, parent_numbering)
                 else:
                     # Top-level entries
-                    organized["level 1"][title] = content
+                    level_key = (1, "")
+
+                group = organized.get(level_key)
+                if group is None:
+                    organized[level_key] = group = {}
+                group[title] = content
             else:
                 # Unnumbered titles
                 unnumbered[title] = content
 
-        # Add unnumbered titles to 'level 0'
+        # Add unnumbered titles to level 0
         if unnumbered:
-            organized["level 0"] = unnumbered
+            organized[(0, None)] = unnumbered
 
-        return dict(organized)
+        return organized
     
     def restructure_levels(self, input_dict):
         """
         Restructure hierarchical levels in the dictionary based on parent numbering and titles.
         
         Args:
-            input_dict (dict): A dictionary with hierarchical levels.
+            input_dict (dict): A dictionary with hierarchical levels, keyed by
+                (level, parent numbering) as built by organize_by_levels_with_grouping.
             
         Returns:
             dict: A new dictionary reorganized based on parent titles with recursive nesting.
         """
         new_dict = {}
+        # Numbering prefix (e.g., "2", "2.", "2.1") -> first title of new_dict starting with it
+        parent_index = {}
+
+        def add_title(title, content):
+            if title not in new_dict:
+                numbering_chars = _NUMBERING_CHARS_RE.match(title).group(0)
+                for end in range(1, len(numbering_chars) + 1):
+                    parent_index.setdefault(numbering_chars[:end], title)
+            new_dict[title] = content
         
         # Process level 0 directly
-        if "level 0" in input_dict:
-            for title, content in input_dict["level 0"].items():
-                new_dict[title] = content
+        if (0, None) in input_dict:
+            for title, content in input_dict[(0, None)].items():
+                add_title(title, content)
 
         # Process top-level keys (e.g., level 1)
-        for key, value in input_dict.items():
-            for i in range(1,5):
-                if key.startswith("level {}".format(i)):
-                    for title, content in value.items():
-                        new_dict[title] = content
+        for (level, _), value in input_dict.items():
+            if 1 <= level <= 4:
+                for title, content in value.items():
+                    add_title(title, content)
 
         # Recursive processing for nested levels
         def add_nested_levels(nested_key, nested_dict):
-            # Extract parent numbering (e.g., "X.Y")
-            parent_key = nested_key.split("for")[-1].strip()
-            parent_title = next((title for title in new_dict if title.startswith(parent_key)), None)
+            # Extract parent numbering (e.g., "X.Y"); nested titles are keyed by their text
+            if isinstance(nested_key, tuple):
+                level, parent_key = nested_key
+                nested_key = sys.intern(f"level {level} for {parent_key}")  # Label used for orphaned levels
+            else:
+                parent_key = nested_key.split("for")[-1].strip()
+
+            # A numbering can only match the leading digits and dots of a title, so it is
+            # looked up in the index; other keys are compared with every title
+            if parent_key and _NUMBERING_CHARS_RE.fullmatch(parent_key):
+                parent_title = parent_index.get(parent_key)
+            else:
+                parent_title = next((title for title in new_dict if title.startswith(parent_key)), None)
 
             if parent_title:
                 # Ensure the parent entry is a dictionary
@@ -1055,13 +1496,13 @@ class PDFExtractor:
                         if isinstance(nested_content, dict):  # Handle deeper nesting
                             add_nested_levels(nested_title, nested_content)
                         else:
-                            new_dict[nested_key] = nested_dict
+                            add_title(nested_key, nested_dict)
                 else:
-                    new_dict[nested_key] = nested_dict
+                    add_title(nested_key, nested_dict)
 
         # Process all nested levels
         for key, sub_dict in input_dict.items():
-            if "for" in key:
+            if key[1]:
                 add_nested_levels(key, sub_dict)
 
         return new_dict
@@ -1080,30 +1521,24 @@ class PDFExtractor:
         Returns:
             dict: Processed and filtered dictionary.
         """
-        def flatten_dict(d, flat_mapping):
+        def collect_entries(d, dict_mapping, string_entries):
             """
-            Recursively flatten the dictionary to build a reference map of key-value pairs.
+            Record the first dictionary value of each key and every string value with the
+            dictionary holding it, in a single depth-first traversal. An explicit stack of
+            item iterators keeps the recursive visiting order without the recursion limit.
             """
-            for key, value in d.items():
-                if key in flat_mapping:
-                    # Only overwrite if the existing value is a string and the new one is a dict
-                    if isinstance(flat_mapping[key], str) and isinstance(value, dict):
-                        flat_mapping[key] = value
+            stack = [(d, iter(d.items()))]
+            while stack:
+                current, items = stack[-1]
+                for key, value in items:
+                    if isinstance(value, dict):
+                        dict_mapping.setdefault(key, value)
+                        stack.append((value, iter(value.items())))
+                        break  # Visit the nested dictionary before the remaining items
+                    elif isinstance(value, str):
+                        string_entries.append((current, key))
                 else:
-                    flat_mapping[key] = value
-                
-                if isinstance(value, dict):
-                    flatten_dict(value, flat_mapping)
-
-        def replace_strings_with_dicts(d, flat_mapping):
-            """
-            Recursively replace string values with dictionary values if applicable.
-            """
-            for key, value in d.items():
-                if isinstance(value, dict):
-                    replace_strings_with_dicts(value, flat_mapping)
-                elif isinstance(value, str) and key in flat_mapping and isinstance(flat_mapping[key], dict):
-                    d[key] = flat_mapping[key]
+                    stack.pop()
 
         def filter_root_keys(d):
             """
@@ -1111,21 +1546,19 @@ class PDFExtractor:
             - Keys without numbering.
             - Keys with numbering in the format X. or X. Something.
             """
-            filtered_dict = {}
-            for key, value in d.items():
-                if not re.match(r'\d+(\.\d+)+', key):  # Exclude keys like X.Y., X.Y.Z., etc.
-                    if re.match(r'\d+\.$', key) or not re.match(r'\d+', key):  # Keep keys like X. or no numbering
-                        filtered_dict[key] = value
-                    elif re.match(r'^\d+\..*$', key) and not re.match(r'\d+\.\d+\.', key):
-                        filtered_dict[key] = value  # Include keys like "3. Methods" or "2. General quality issues"
-            return filtered_dict
-
-        # Step 1: Build a flat reference mapping
+            # Keys like X.Y., X.Y.Z., etc. are excluded
+            return {key: value for key, value in d.items() if _ROOT_KEY_RE.match(key)}
+
+        # Step 1: Collect the dictionary values by key and the string values to resolve
         reference_mapping = {}
-        flatten_dict(data, reference_mapping)
+        string_entries = []
+        collect_entries(data, reference_mapping, string_entries)
 
-        # Step 2: Replace strings with dicts based on the reference mapping
-        replace_strings_with_dicts(data, reference_mapping)
+        # Step 2: Replace strings with the dictionary found under the same key, if any
+        for d, key in string_entries:
+            replacement = reference_mapping.get(key)
+            if replacement is not None:
+                d[key] = replacement
 
         # Step 3: Filter root-level keys
         return filter_root_keys(data)
@@ -1161,13 +1594,21 @@ class PDFExtractor:
             except Exception as e:
                 logging.error(f"Step 2 failed: Failed to structure raw text by TOC: {e}")
 
+            # Without sections, steps 3 to 7 have nothing to process: only the metadata
+            # and the cleaned text are saved
+            if not structured_processed_text:
+                try:
+                    self._add_metadata_and_cleaned_text(data)
+                except Exception as e:
+                    logging.error(f"Failed to extract metadata or cleaned text: {e}")
+                return self._save_json(data)
+
             # Step 3: Extract sections and refine structure
             try:
-                if structured_processed_text:
-                    titles = list(structured_processed_text.keys())
-                    structured_processed_text = self.extract_sections_from_processed_text(
-                        titles=titles, processed_text=structured_processed_text
-                    )
+                titles = list(structured_processed_text.keys())
+                structured_processed_text = self.extract_sections_from_processed_text(
+                    titles=titles, processed_text=structured_processed_text
+                )
             except Exception as e:
                 logging.error(f"Step 3 failed: Failed to extract sections: {e}")
 
@@ -1182,9 +1623,7 @@ class PDFExtractor:
             # Step 5: Normalize keys, refine numbering, and clean text
             try:
                 if structured_processed_text:
-                    structured_processed_text = self.normalize_keys_with_numbering(structured_processed_text)
-                    structured_processed_text = self.find_and_replace_numberings(structured_processed_text)
-                    structured_processed_text = self.remove_title_from_text(structured_processed_text)
+                    structured_processed_text = self._normalize_renumber_strip(structured_processed_text)
             except Exception as e:
                 logging.error(f"Step 5 failed: Failed during normalization or text cleaning: {e}")
 
@@ -1209,31 +1648,59 @@ class PDFExtractor:
 
             # Populate final data structure
             try:
-                data["metadata"] = self.extract_metadata()
                 data["leveled_text"] = leveled_text
                 data["processed_text"] = structured_processed_text
-                data["cleaned_text"] = self.extract_pdf_textand_clean()
+                self._add_metadata_and_cleaned_text(data)
             except Exception as e:
                 logging.error(f"Step 7 failed: Failed to extract metadata or process final structure: {e}")
 
         except Exception as e:
             # Log fallback error
             logging.error(f"Pipeline encountered an unexpected error: {e}")
-            data["metadata"] = self.extract_metadata()
-            data["cleaned_text"] = self.extract_pdf_textand_clean()
+            self._add_metadata_and_cleaned_text(data)
 
-        # Step 8: Save the processed data to a JSON file with ordered keys
-        ordered_data = OrderedDict([
-            ("metadata", data.get("metadata", {})),
-            ("leveled_text", data.get("leveled_text", {})),
-            ("processed_text", data.get("processed_text", {})),
-            ("cleaned_text", data.get("cleaned_text", ""))
-        ])
+        # Step 8: Save the processed data to a JSON file
+        return self._save_json(data)
 
+    def _add_metadata_and_cleaned_text(self, data):
+        """
+        Adds the document metadata and its cleaned full text to the extracted data.
+
+        Args:
+            data (dict): The extracted data, updated in place.
+        """
+        data["metadata"] = self.extract_metadata()
+        data["cleaned_text"] = self.extract_pdf_textand_clean()
+
+    def _save_json(self, data):
+        """
+        Saves the extracted data to the document's JSON file and releases the page caches.
+        json_output_path is set to the file written, or None if saving failed.
+
+        Args:
+            data (dict): The extracted data.
+
+        Returns:
+            dict: The saved data, with its keys in output order.
+        """
+        # Save the data with ordered keys (dicts keep insertion order)
+        ordered_data = {
+            "metadata": data.get("metadata", {}),
+            "leveled_text": data.get("leveled_text", {}),
+            "processed_text": data.get("processed_text", {}),
+            "cleaned_text": data.get("cleaned_text", "")
+        }
+
+        self.json_output_path = None
         try:
             json_output_path = os.path.join(self.doc_output_folder, f"{self.doc_name}_data.json")
-            with open(json_output_path, 'w', encoding='utf-8') as json_file:
-                json.dump(ordered_data, json_file, indent=4, ensure_ascii=False)
+            if orjson is not None:
+                with open(json_output_path, 'wb') as json_file:
+                    json_file.write(orjson.dumps(ordered_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(json_output_path, 'w', encoding='utf-8') as json_file:
+                    json.dump(ordered_data, json_file, indent=4, ensure_ascii=False)
+            self.json_output_path = json_output_path
         except FileNotFoundError:
             logging.error(f"Step 8 failed: Output folder '{self.doc_output_folder}' does not exist.")
         except IOError as e:
@@ -1241,4 +1708,7 @@ class PDFExtractor:
         except Exception as e:
             logging.error(f"Step 8 failed: Unexpected error while saving JSON: {e}")
 
+        # The page text is no longer needed once the document is saved
+        self._clear_page_caches()
+
         return ordered_data